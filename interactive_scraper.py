@@ -5,63 +5,153 @@ Just run this script and enter any website URL to scrape!
 """
 
 import asyncio
+import concurrent.futures
+import os
+
 import aiohttp
-from bs4 import BeautifulSoup
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+from bs4 import BeautifulSoup, SoupStrainer
 import json
 import time
-from datetime import datetime
-from urllib.parse import urljoin, urlparse
+from datetime import datetime, timezone
+from urllib.parse import urljoin, urlparse, urlsplit, urlunsplit
+
+# Fallback parser: only materialize the tags we actually extract
+STRAINER = SoupStrainer(['title', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'a', 'img', 'meta'])
+HEADING_SET = frozenset(('h1', 'h2', 'h3', 'h4', 'h5', 'h6'))
+_HTTP = ('http://', 'https://')
+MAX_RESPONSE_BYTES = 5 * 1024 * 1024  # refuse to parse bodies beyond this
+
+# Repeated strings (meta names, nav hrefs, alt text) show up on every page of
+# a crawl; dedup them so the retained summary holds one copy of each
+_INTERN = {}
+
+def _intern(s: str) -> str:
+    if len(_INTERN) >= 10000:
+        return s
+    return _INTERN.setdefault(s, s)
+
+
+def canonicalize_url(link_url: str) -> str:
+    """Normalize a crawl candidate: strip fragments and trailing slashes"""
+    parts = urlsplit(link_url)
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme, parts.netloc, path, parts.query, ''))
+
+def resolve_src(src: str, page_url: str, scheme: str, base_origin: str) -> str:
+    """urljoin without re-parsing the base URL for the common src shapes"""
+    if src.startswith(('http://', 'https://')):
+        return src
+    if src.startswith('//'):
+        return f"{scheme}:{src}"
+    if src.startswith('/'):
+        return base_origin + src
+    return urljoin(page_url, src)
+
+
+def build_session() -> aiohttp.ClientSession:
+    """Create a pooled keep-alive session shared across a whole crawl"""
+    connector = aiohttp.TCPConnector(
+        limit=64,
+        limit_per_host=8,
+        ttl_dns_cache=300,
+        keepalive_timeout=30
+    )
+    timeout = aiohttp.ClientTimeout(total=30, connect=5, sock_read=15)
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=timeout,
+        headers={'Accept-Encoding': 'gzip, br', 'User-Agent': 'scraper/1.0'},
+        auto_decompress=True
+    )
+
+
 
 async def scrape_website(url: str, depth: int = 1, max_pages: int = 5):
-    """Scrape a website and extract data"""
+    """Scrape a website with a session owned for the duration of the call"""
+    async with build_session() as session:
+        return await scrape_website_with_session(session, url, depth, max_pages)
+
+async def scrape_website_with_session(session: aiohttp.ClientSession, url: str,
+                                      depth: int = 1, max_pages: int = 5):
+    """Scrape a website and extract data using a caller-provided session"""
     print(f"🕷️  Starting to scrape: {url}")
     print(f"📊 Depth: {depth}, Max pages: {max_pages}")
     print("=" * 50)
     
     start_time = time.time()
+    # One timestamp per batch: every page shares it, and we skip a
+    # clock_gettime + strftime round-trip per scraped page
+    batch_ts = datetime.now(timezone.utc).isoformat()
     scraped_pages = []
     visited_urls = set()
+    base_prefix = url
+    scheduled = {url}
     urls_to_visit = [url]
+    totals = {'headings': 0, 'paragraphs': 0, 'links': 0, 'images': 0, 'content_length': 0}
     
-    async with aiohttp.ClientSession() as session:
-        for current_depth in range(depth):
-            if not urls_to_visit or len(scraped_pages) >= max_pages:
-                break
-                
-            current_urls = urls_to_visit.copy()
-            urls_to_visit = []
-            
-            print(f"🔍 Scraping depth {current_depth + 1}...")
+    # Bound in-flight pages so peak memory stays O(8 * page size) even
+    # when one level of the crawl fans out to every link on a page
+    sem = asyncio.Semaphore(8)
+
+    async def bounded_scrape(page_url: str) -> dict:
+        async with sem:
+            return await scrape_single_page(session, page_url, batch_ts)
+
+    for current_depth in range(depth):
+        if not urls_to_visit or len(scraped_pages) >= max_pages:
+            break
             
-            # Scrape current level URLs
-            tasks = []
-            for url_to_scrape in current_urls:
-                if url_to_scrape not in visited_urls and len(scraped_pages) < max_pages:
-                    visited_urls.add(url_to_scrape)
-                    tasks.append(scrape_single_page(session, url_to_scrape))
+        current_urls = urls_to_visit.copy()
+        urls_to_visit = []
+        
+        print(f"🔍 Scraping depth {current_depth + 1}...")
+        
+        # Scrape current level URLs
+        tasks = []
+        for url_to_scrape in current_urls:
+            if url_to_scrape not in visited_urls and len(scraped_pages) < max_pages:
+                visited_urls.add(url_to_scrape)
+                tasks.append(bounded_scrape(url_to_scrape))
+        
+        if tasks:
+            results = await asyncio.gather(*tasks, return_exceptions=True)
             
-            if tasks:
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-                
-                for result in results:
-                    if isinstance(result, dict) and "error" not in result:
-                        scraped_pages.append(result)
-                        print(f"✅ Scraped: {result['url']}")
-                        print(f"   📄 Title: {result['title']}")
-                        print(f"   📝 Headings: {len(result['headings'])}")
-                        print(f"   📖 Paragraphs: {len(result['paragraphs'])}")
-                        print(f"   🔗 Links: {len(result['links'])}")
-                        print(f"   🖼️  Images: {len(result['images'])}")
-                        print()
-                        
-                        # Collect links for next depth level
-                        if current_depth < depth - 1:
-                            for link in result.get("links", []):
-                                link_url = link.get("url")
-                                if link_url and link_url.startswith(url) and link_url not in visited_urls:
-                                    urls_to_visit.append(link_url)
-                    elif isinstance(result, Exception):
-                        print(f"❌ Error: {result}")
+            for result in results:
+                if isinstance(result, dict) and "error" not in result:
+                    scraped_pages.append(result)
+                    totals['headings'] += result['headings_count']
+                    totals['paragraphs'] += result['paragraphs_count']
+                    totals['links'] += result['links_count']
+                    totals['images'] += result['images_count']
+                    totals['content_length'] += result['content_length']
+                    print(f"✅ Scraped: {result['url']}")
+                    print(f"   📄 Title: {result['title']}")
+                    print(f"   📝 Headings: {len(result['headings'])}")
+                    print(f"   📖 Paragraphs: {len(result['paragraphs'])}")
+                    print(f"   🔗 Links: {len(result['links'])}")
+                    print(f"   🖼️  Images: {len(result['images'])}")
+                    print()
+                    
+                    # Collect links for next depth level, deduplicating at
+                    # enqueue time so repeated links never re-enter the queue
+                    if current_depth < depth - 1:
+                        for link in result.get("links", []):
+                            link_url = link.get("url")
+                            if not link_url:
+                                continue
+                            link_url = canonicalize_url(link_url)
+                            if (link_url.startswith(base_prefix)
+                                    and link_url not in visited_urls
+                                    and link_url not in scheduled):
+                                scheduled.add(link_url)
+                                urls_to_visit.append(link_url)
+                elif isinstance(result, Exception):
+                    print(f"❌ Error: {result}")
     
     end_time = time.time()
     
@@ -74,90 +164,179 @@ async def scrape_website(url: str, depth: int = 1, max_pages: int = 5):
         "max_pages": max_pages,
         "pages": scraped_pages,
         "summary": {
-            "total_headings": sum(len(page.get("headings", [])) for page in scraped_pages),
-            "total_paragraphs": sum(len(page.get("paragraphs", [])) for page in scraped_pages),
-            "total_links": sum(len(page.get("links", [])) for page in scraped_pages),
-            "total_images": sum(len(page.get("images", [])) for page in scraped_pages),
-            "total_content_length": sum(page.get("content_length", 0) for page in scraped_pages)
+            "total_headings": totals['headings'],
+            "total_paragraphs": totals['paragraphs'],
+            "total_links": totals['links'],
+            "total_images": totals['images'],
+            "total_content_length": totals['content_length']
         },
-        "scraped_at": datetime.now().isoformat()
+        "scraped_at": batch_ts
     }
     
     return summary
 
-async def scrape_single_page(session: aiohttp.ClientSession, url: str) -> dict:
+_PARSE_POOL = None
+
+def _parse_pool() -> concurrent.futures.ProcessPoolExecutor:
+    """Worker pool for CPU-bound parsing, created on first use and kept for
+    the life of the process so the event loop only ever does network I/O"""
+    global _PARSE_POOL
+    if _PARSE_POOL is None:
+        _PARSE_POOL = concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _PARSE_POOL
+
+def parse_page(url: str, html_bytes: bytes, content_length: int,
+               scraped_at: str = None) -> dict:
+    """Pure-CPU extraction of one fetched page; runs in a worker process"""
+    if scraped_at is None:
+        scraped_at = datetime.now(timezone.utc).isoformat()
+    # Parse the base URL once for the whole page's media resolution
+    parts = urlsplit(url)
+    base_origin = f"{parts.scheme}://{parts.netloc}"
+
+    if SELECTOLAX_AVAILABLE:
+        tree = LexborHTMLParser(html_bytes)
+
+        # Extract basic data
+        title = tree.css_first('title')
+        title_text = title.text(strip=True) if title else "No title"
+
+        # Extract headings (one CSS query instead of six tree walks)
+        headings = []
+        for heading in tree.css('h1,h2,h3,h4,h5,h6'):
+            headings.append(heading.text(strip=True))
+
+        # Extract paragraphs
+        paragraphs = []
+        for p in tree.css('p'):
+            text = p.text(strip=True)
+            if text and len(text) > 20:  # Only meaningful paragraphs
+                paragraphs.append(text)
+
+        # Extract links: ordered dedup in one pass, stopping at the cap
+        seen_links = {}
+        for a in tree.css('a[href]'):
+            href = a.attributes.get('href')
+            if not href or not href.startswith(_HTTP) or href in seen_links:
+                continue
+            seen_links[href] = a.text(strip=True)[:100]
+            if len(seen_links) >= 100:
+                break
+        links = [{"url": _intern(u), "text": t} for u, t in seen_links.items()]
+
+        # Extract images
+        images = []
+        for img in tree.css('img[src]'):
+            src = img.attributes.get('src')
+            if src:
+                full_url = resolve_src(src, url, parts.scheme, base_origin)
+                images.append({
+                    "src": full_url,
+                    "alt": _intern(img.attributes.get('alt') or ''),
+                    "title": _intern(img.attributes.get('title') or '')
+                })
+
+        # Extract meta data
+        meta_data = {}
+        for meta in tree.css('meta'):
+            name = meta.attributes.get('name') or meta.attributes.get('property')
+            content = meta.attributes.get('content')
+            if name and content:
+                meta_data[_intern(name)] = content
+    else:
+        # Fallback: bs4 with the lxml C parser, restricted to needed tags
+        soup = BeautifulSoup(html_bytes, 'lxml', parse_only=STRAINER)
+
+        # Single pass over the tree instead of one find_all per tag,
+        # skipping work for categories that already hit their caps
+        title_text = "No title"
+        headings = []
+        paragraphs = []
+        seen_links = {}
+        images = []
+        meta_data = {}
+        for el in soup.descendants:
+            name = getattr(el, 'name', None)
+            if name is None:
+                continue
+            if name in HEADING_SET:
+                if len(headings) < 20:
+                    headings.append(el.get_text().strip())
+            elif name == 'p':
+                if len(paragraphs) < 50:
+                    text = el.get_text().strip()
+                    if text and len(text) > 20:  # Only meaningful paragraphs
+                        paragraphs.append(text)
+            elif name == 'a':
+                if len(seen_links) < 100:
+                    href = el.get('href')
+                    if href and href.startswith(_HTTP) and href not in seen_links:
+                        seen_links[href] = el.get_text().strip()[:100]
+            elif name == 'img':
+                if len(images) < 50:
+                    src = el.get('src')
+                    if src:
+                        full_url = resolve_src(src, url, parts.scheme, base_origin)
+                        images.append({
+                            "src": full_url,
+                            "alt": _intern(el.get('alt', '')),
+                            "title": _intern(el.get('title', ''))
+                        })
+            elif name == 'meta':
+                meta_name = el.get('name') or el.get('property')
+                content = el.get('content')
+                if meta_name and content:
+                    meta_data[_intern(meta_name)] = content
+            elif name == 'title' and title_text == "No title":
+                title_text = el.get_text().strip() or "No title"
+        links = [{"url": _intern(u), "text": t} for u, t in seen_links.items()]
+    
+    return {
+        "url": url,
+        "title": title_text,
+        "headings": headings[:20],  # Limit to 20 headings
+        "paragraphs": paragraphs[:50],  # Limit to 50 paragraphs
+        "links": links[:100],  # Limit to 100 links
+        "images": images[:50],  # Limit to 50 images
+        "meta": meta_data,
+        "content_length": content_length,
+        "headings_count": len(headings),
+        "paragraphs_count": len(paragraphs),
+        "links_count": len(links),
+        "images_count": len(images),
+        "scraped_at": scraped_at
+    }
+
+async def scrape_single_page(session: aiohttp.ClientSession, url: str,
+                             scraped_at: str = None) -> dict:
     """Scrape a single page and extract data"""
     try:
-        async with session.get(url, timeout=30) as response:
+        async with session.get(url) as response:
             if response.status != 200:
                 return {"error": f"HTTP {response.status}", "url": url}
             
-            html = await response.text()
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # Extract basic data
-            title = soup.find('title')
-            title_text = title.get_text().strip() if title else "No title"
-            
-            # Extract headings
-            headings = []
-            for tag in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-                for heading in soup.find_all(tag):
-                    headings.append(heading.get_text().strip())
-            
-            # Extract paragraphs
-            paragraphs = []
-            for p in soup.find_all('p'):
-                text = p.get_text().strip()
-                if text and len(text) > 20:  # Only meaningful paragraphs
-                    paragraphs.append(text)
-            
-            # Extract links
-            links = []
-            for a in soup.find_all('a', href=True):
-                href = a.get('href')
-                if href and href.startswith(('http', 'https')):
-                    links.append({
-                        "url": href,
-                        "text": a.get_text().strip()[:100]
-                    })
-            
-            # Extract images
-            images = []
-            for img in soup.find_all('img', src=True):
-                src = img.get('src')
-                if src:
-                    full_url = urljoin(url, src)
-                    images.append({
-                        "src": full_url,
-                        "alt": img.get('alt', ''),
-                        "title": img.get('title', '')
-                    })
-            
-            # Extract meta data
-            meta_data = {}
-            for meta in soup.find_all('meta'):
-                name = meta.get('name') or meta.get('property')
-                content = meta.get('content')
-                if name and content:
-                    meta_data[name] = content
-            
-            return {
-                "url": url,
-                "title": title_text,
-                "headings": headings[:20],  # Limit to 20 headings
-                "paragraphs": paragraphs[:50],  # Limit to 50 paragraphs
-                "links": links[:100],  # Limit to 100 links
-                "images": images[:50],  # Limit to 50 images
-                "meta": meta_data,
-                "content_length": len(html),
-                "headings_count": len(headings),
-                "paragraphs_count": len(paragraphs),
-                "links_count": len(links),
-                "images_count": len(images),
-                "scraped_at": datetime.now().isoformat()
-            }
-            
+            # Skip non-HTML responses before paying any parse cost
+            if response.content_type not in ('text/html', 'application/xhtml+xml'):
+                return {"error": f"skipped: non-html ({response.content_type})", "url": url}
+
+            if response.content_length and response.content_length > MAX_RESPONSE_BYTES:
+                return {"error": "skipped: too-large", "url": url}
+
+            # Read raw bytes incrementally, bounding memory per in-flight page;
+            # the C parsers decode once internally, so we also skip aiohttp's
+            # charset detection + str round-trip entirely
+            buf = bytearray()
+            async for chunk in response.content.iter_chunked(64 * 1024):
+                buf.extend(chunk)
+                if len(buf) > MAX_RESPONSE_BYTES:
+                    return {"error": "skipped: too-large", "url": url}
+            html_bytes = bytes(buf)
+            content_length = int(response.headers.get('Content-Length') or len(html_bytes))
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _parse_pool(), parse_page, url, html_bytes, content_length, scraped_at)
+
     except Exception as e:
         return {"error": str(e), "url": url}
 
@@ -168,7 +347,9 @@ def save_results(results: dict, filename: str = None):
         filename = f"scraped_data_{timestamp}.json"
     
     with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+        # Compact separators keep json.dump on its C encoder fast path;
+        # indent would force the slow pure-Python path and ~2x the bytes
+        json.dump(results, f, ensure_ascii=False, separators=(',', ':'))
     
     print(f"💾 Results saved to: {filename}")
 
@@ -241,32 +422,36 @@ def get_user_input():
 async def main():
     """Main function"""
     try:
-        # Get user input
-        url, depth, max_pages = get_user_input()
-        
-        print(f"\n🚀 Starting to scrape: {url}")
-        print(f"📊 Settings: Depth={depth}, Max Pages={max_pages}")
-        print("=" * 50)
-        
-        # Scrape the website
-        results = await scrape_website(url, depth, max_pages)
-        
-        # Print summary
-        print_summary(results)
-        
-        # Ask if user wants to save results
-        save_choice = input("\n💾 Save results to file? (y/n, default: y): ").strip().lower()
-        if save_choice != 'n':
-            save_results(results)
-        
-        print("\n🎉 Scraping completed successfully!")
-        
-        # Ask if user wants to scrape another website
-        again = input("\n🔄 Scrape another website? (y/n, default: n): ").strip().lower()
-        if again == 'y':
-            print("\n" + "=" * 50)
-            await main()
-        
+        # One session serves the whole interactive run, so keep-alive
+        # sockets and the DNS cache carry over between scrapes
+        async with build_session() as session:
+            while True:
+                # Get user input
+                url, depth, max_pages = get_user_input()
+
+                print(f"\n🚀 Starting to scrape: {url}")
+                print(f"📊 Settings: Depth={depth}, Max Pages={max_pages}")
+                print("=" * 50)
+
+                # Scrape the website
+                results = await scrape_website_with_session(session, url, depth, max_pages)
+
+                # Print summary
+                print_summary(results)
+
+                # Ask if user wants to save results
+                save_choice = input("\n💾 Save results to file? (y/n, default: y): ").strip().lower()
+                if save_choice != 'n':
+                    save_results(results)
+
+                print("\n🎉 Scraping completed successfully!")
+
+                # Ask if user wants to scrape another website
+                again = input("\n🔄 Scrape another website? (y/n, default: n): ").strip().lower()
+                if again != 'y':
+                    break
+                print("\n" + "=" * 50)
+
     except KeyboardInterrupt:
         print("\n\n⏹️  Scraping interrupted by user")
     except Exception as e:
@@ -12,10 +12,15 @@ import os
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
+# One pooled session for the whole script: keep-alive sockets make the
+# status-polling loop free instead of paying a TCP connect per request
+SESSION = requests.Session()
+SESSION.mount('http://', requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
 def test_api_health():
     """Test if the API is running"""
     try:
-        response = requests.get("http://localhost:8000/health", timeout=5)
+        response = SESSION.get("http://localhost:8000/health", timeout=5)
         if response.status_code == 200:
             print("✅ API is running!")
             return True
@@ -52,7 +57,7 @@ def test_scraping():
             }
             
             print("🚀 Starting scraping task...")
-            response = requests.post("http://localhost:8000/scrape", json=payload, timeout=10)
+            response = SESSION.post("http://localhost:8000/scrape", json=payload, timeout=10)
             
             if response.status_code != 200:
                 print(f"❌ Failed to start scraping: {response.status_code}")
@@ -67,16 +72,17 @@ def test_scraping():
             print("⏳ Waiting for completion...")
             start_time = time.time()
             timeout = 30
+            poll_delay = 0.5
             
             while time.time() - start_time < timeout:
                 # Check status
-                status_response = requests.get(f"http://localhost:8000/task/{task_id}", timeout=5)
+                status_response = SESSION.get(f"http://localhost:8000/task/{task_id}", timeout=5)
                 if status_response.status_code == 200:
                     status_data = status_response.json()
                     
                     if status_data["status"] == "completed":
                         # Get results
-                        result_response = requests.get(f"http://localhost:8000/result/{task_id}", timeout=5)
+                        result_response = SESSION.get(f"http://localhost:8000/result/{task_id}", timeout=5)
                         if result_response.status_code == 200:
                             result = result_response.json()
                             
@@ -100,7 +106,8 @@ def test_scraping():
                         break
                     else:
                         print(f"⏳ Status: {status_data['status']} ({status_data['progress']}%)")
-                        time.sleep(2)
+                        time.sleep(poll_delay)
+                        poll_delay = min(poll_delay * 2, 2.0)
                 else:
                     print(f"❌ Failed to check status: {status_response.status_code}")
                     break
@@ -123,9 +130,9 @@ def test_api_endpoints():
     for method, endpoint, description in endpoints:
         try:
             if method == "GET":
-                response = requests.get(f"http://localhost:8000{endpoint}", timeout=5)
+                response = SESSION.get(f"http://localhost:8000{endpoint}", timeout=5)
             else:
-                response = requests.post(f"http://localhost:8000{endpoint}", timeout=5)
+                response = SESSION.post(f"http://localhost:8000{endpoint}", timeout=5)
             
             if response.status_code == 200:
                 print(f"✅ {description}: OK")
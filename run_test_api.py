@@ -24,12 +24,19 @@ def main():
     print("🏥 Health Check: http://localhost:8000/health")
     print("=" * 50)
     
+    # The watchfiles reloader steals CPU during benchmarks; only enable it
+    # when explicitly developing (DEV=1). uvloop + httptools are the C
+    # event loop / HTTP parser fast path.
+    dev_mode = os.getenv("DEV", "0") == "1"
     uvicorn.run(
         "src.test_api:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
-        log_level="info"
+        reload=dev_mode,
+        loop="uvloop",
+        http="httptools",
+        log_level="info" if dev_mode else "warning",
+        access_log=dev_mode
     )
 
 if __name__ == "__main__":
@@ -7,71 +7,55 @@ import subprocess
 import sys
 import os
 
-def run_tests():
-    """Run the pytest tests"""
-    print("🧪 Running Web Scraper Tests")
-    print("=" * 40)
-    
-    # Check if pytest is installed
+# Shared pytest flags; cacheprovider is skipped to avoid plugin setup cost
+BASE_ARGS = ["-v", "--tb=short", "--asyncio-mode=auto", "-p", "no:cacheprovider"]
+
+def _run_pytest(args):
+    """Run pytest in-process; fall back to a subprocess only if the import
+    fails, so the common path skips interpreter startup and plugin re-imports"""
     try:
         import pytest
     except ImportError:
         print("❌ pytest not found. Installing dependencies...")
         subprocess.run([sys.executable, "-m", "pip", "install", "-r", "test_requirements.txt"])
-    
-    # Run tests
+        return subprocess.run([sys.executable, "-m", "pytest"] + args).returncode
+
+    return pytest.main(args)
+
+def run_tests():
+    """Run the pytest tests"""
+    print("🧪 Running Web Scraper Tests")
+    print("=" * 40)
+
     print("🚀 Starting tests...")
-    result = subprocess.run([
-        sys.executable, "-m", "pytest", 
-        "tests/", 
-        "-v", 
-        "--tb=short",
-        "--asyncio-mode=auto"
-    ])
-    
-    if result.returncode == 0:
+    returncode = _run_pytest(["tests/"] + BASE_ARGS)
+
+    if returncode == 0:
         print("\n✅ All tests passed!")
     else:
         print("\n❌ Some tests failed!")
-    
-    return result.returncode
+
+    return returncode
 
 def run_specific_test(test_name):
     """Run a specific test"""
     print(f"🧪 Running specific test: {test_name}")
     print("=" * 40)
-    
-    result = subprocess.run([
-        sys.executable, "-m", "pytest", 
-        f"tests/test_scraping.py::{test_name}",
-        "-v",
-        "--tb=short",
-        "--asyncio-mode=auto"
-    ])
-    
-    return result.returncode
+
+    return _run_pytest([f"tests/test_scraping.py::{test_name}"] + BASE_ARGS)
 
 def run_quick_tests():
     """Run only quick tests (skip slow ones)"""
     print("⚡ Running quick tests only...")
     print("=" * 40)
-    
-    result = subprocess.run([
-        sys.executable, "-m", "pytest", 
-        "tests/",
-        "-v",
-        "--tb=short",
-        "--asyncio-mode=auto",
-        "-m", "not slow"
-    ])
-    
-    return result.returncode
+
+    return _run_pytest(["tests/"] + BASE_ARGS + ["-m", "not slow"])
 
 def main():
     """Main function"""
     if len(sys.argv) > 1:
         command = sys.argv[1]
-        
+
         if command == "quick":
             return run_quick_tests()
         elif command == "specific" and len(sys.argv) > 2:
@@ -87,4 +71,4 @@ def main():
 
 if __name__ == "__main__":
     exit_code = main()
-    sys.exit(exit_code) 
\ No newline at end of file
+    sys.exit(exit_code)
@@ -14,16 +14,25 @@ celery_app = Celery(
 
 # Celery settings
 celery_app.conf.update(
-    task_serializer='json',
-    accept_content=['json'],
-    result_serializer='json',
+    task_serializer='msgpack',
+    accept_content=['msgpack', 'json'],  # keep json accepted during rollout
+    result_serializer='msgpack',
+    task_compression='gzip',
+    result_compression='gzip',
+    result_backend_transport_options={'socket_keepalive': True},
     timezone='UTC',
     enable_utc=True,
     task_track_started=True,
     task_time_limit=30 * 60,  # 30 minutes
     task_soft_time_limit=25 * 60,  # 25 minutes
+    task_acks_late=True,  # a worker crash mid-parse requeues the task
+    task_reject_on_worker_lost=True,
     worker_prefetch_multiplier=1,
-    worker_max_tasks_per_child=1000,
+    # bs4/lxml retain C-heap until process exit; recycle workers to free it
+    worker_max_tasks_per_child=100,
+    worker_max_memory_per_child=512_000,  # KB
+    broker_pool_limit=20,
+    broker_transport_options={'visibility_timeout': 3600},
     result_expires=3600,  # 1 hour
 )
 
@@ -0,0 +1,39 @@
+import hashlib
+import math
+
+class BloomFilter:
+    """Fixed-memory set membership with a tunable false-positive rate
+
+    Backed by a plain bytearray; k bit positions per item are derived
+    from one BLAKE2b digest split into two 64-bit halves (the standard
+    double-hashing scheme), so adding a URL costs a single hash call.
+    Lookups can report a false positive at roughly `error_rate` once
+    `capacity` items are in, but never a false negative. There is no
+    removal and no TTL - callers should treat a hit as "probably seen"
+    and size the filter for the lifetime of the process.
+    """
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001):
+        num_bits = math.ceil(
+            -capacity * math.log(error_rate) / (math.log(2) ** 2)
+        )
+        self._num_bits = num_bits
+        self._num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        self._bits = bytearray((num_bits + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big")
+        for i in range(self._num_hashes):
+            yield (h1 + i * h2) % self._num_bits
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[pos >> 3] & (1 << (pos & 7))
+            for pos in self._positions(item)
+        )
@@ -0,0 +1,75 @@
+import zstandard
+
+class ZstdMiddleware:
+    """Compress responses with zstd for clients that advertise it
+
+    zstd compresses several times faster than gzip at comparable or better
+    ratios, so it takes priority when `Accept-Encoding: zstd` is present.
+    The middleware rewrites the inbound Accept-Encoding to `identity`
+    before calling further in, which keeps GZipMiddleware from encoding
+    the same body a second time; clients without zstd support fall
+    through untouched and get gzip as before.
+    """
+
+    def __init__(self, app, minimum_size: int = 1000, level: int = 3):
+        self.app = app
+        self.minimum_size = minimum_size
+        self._compressor = zstandard.ZstdCompressor(level=level)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = scope.get("headers", [])
+        accept_encoding = b""
+        for k, v in headers:
+            if k == b"accept-encoding":
+                accept_encoding = v
+                break
+        if b"zstd" not in accept_encoding:
+            await self.app(scope, receive, send)
+            return
+
+        # Claim the encoding: inner middlewares see identity only
+        scope = dict(scope)
+        scope["headers"] = [
+            (k, b"identity") if k == b"accept-encoding" else (k, v)
+            for k, v in headers
+        ]
+
+        initial_message = None
+        body = bytearray()
+
+        async def send_wrapper(message):
+            nonlocal initial_message
+            if message["type"] == "http.response.start":
+                initial_message = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+            body.extend(message.get("body", b""))
+            if message.get("more_body"):
+                return
+
+            raw_headers = list(initial_message.get("headers", []))
+            already_encoded = any(k == b"content-encoding" for k, _ in raw_headers)
+            if already_encoded or len(body) < self.minimum_size:
+                await send(initial_message)
+                await send({"type": "http.response.body", "body": bytes(body)})
+                return
+
+            compressed = self._compressor.compress(bytes(body))
+            raw_headers = [
+                (k, v) for k, v in raw_headers if k != b"content-length"
+            ]
+            raw_headers.append((b"content-encoding", b"zstd"))
+            raw_headers.append((b"content-length", b"%d" % len(compressed)))
+            raw_headers.append((b"vary", b"Accept-Encoding"))
+            initial_message = dict(initial_message)
+            initial_message["headers"] = raw_headers
+            await send(initial_message)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_wrapper)
@@ -1,13 +1,31 @@
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.exceptions import RequestValidationError
+import functools
 import logging
+import orjson
 from typing import Dict, Any
 
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=128)
+def _error_body_prefix(error_code: str, message: str) -> bytes:
+    """Pre-serialized static part of an error body, keyed by (code, message)
+
+    Error payloads only differ in their timestamp, so under a burst (rate
+    limiting, auth failures) the dict build + serialization happens once per
+    distinct code/message pair instead of per response.
+    """
+    return orjson.dumps({"error": {"code": error_code, "message": message}})[:-2]
+
+def _error_response(status_code: int, error_code: str, message: str, ts_ns) -> Response:
+    body = _error_body_prefix(error_code, message) + b',"timestamp":' + orjson.dumps(ts_ns) + b'}}'
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
 class AppException(Exception):
     """Base application exception"""
+    __slots__ = ("status_code", "detail", "error_code")
+
     def __init__(self, status_code: int, detail: str, error_code: str = None):
         self.status_code = status_code
         self.detail = detail
@@ -16,111 +34,130 @@ class AppException(Exception):
 
 class ValidationException(AppException):
     """Validation error exception"""
+    __slots__ = ()
+
     def __init__(self, detail: str, error_code: str = "VALIDATION_ERROR"):
         super().__init__(status.HTTP_422_UNPROCESSABLE_ENTITY, detail, error_code)
 
 class AuthenticationException(AppException):
     """Authentication error exception"""
+    __slots__ = ()
+
     def __init__(self, detail: str = "Authentication failed", error_code: str = "AUTH_ERROR"):
         super().__init__(status.HTTP_401_UNAUTHORIZED, detail, error_code)
 
 class AuthorizationException(AppException):
     """Authorization error exception"""
+    __slots__ = ()
+
     def __init__(self, detail: str = "Insufficient permissions", error_code: str = "FORBIDDEN"):
         super().__init__(status.HTTP_403_FORBIDDEN, detail, error_code)
 
 class NotFoundException(AppException):
     """Resource not found exception"""
+    __slots__ = ()
+
     def __init__(self, detail: str = "Resource not found", error_code: str = "NOT_FOUND"):
         super().__init__(status.HTTP_404_NOT_FOUND, detail, error_code)
 
 class RateLimitException(AppException):
     """Rate limiting exception"""
+    __slots__ = ()
+
     def __init__(self, detail: str = "Rate limit exceeded", error_code: str = "RATE_LIMIT"):
         super().__init__(status.HTTP_429_TOO_MANY_REQUESTS, detail, error_code)
 
 class ScrapingException(AppException):
     """Scraping operation exception"""
+    __slots__ = ()
+
     def __init__(self, detail: str = "Scraping operation failed", error_code: str = "SCRAPING_ERROR"):
         super().__init__(status.HTTP_500_INTERNAL_SERVER_ERROR, detail, error_code)
 
 class DatabaseException(AppException):
     """Database operation exception"""
+    __slots__ = ()
+
     def __init__(self, detail: str = "Database operation failed", error_code: str = "DB_ERROR"):
         super().__init__(status.HTTP_500_INTERNAL_SERVER_ERROR, detail, error_code)
 
 class ExternalServiceException(AppException):
     """External service exception"""
+    __slots__ = ()
+
     def __init__(self, detail: str = "External service error", error_code: str = "EXTERNAL_ERROR"):
         super().__init__(status.HTTP_502_BAD_GATEWAY, detail, error_code)
 
-async def app_exception_handler(request: Request, exc: AppException) -> JSONResponse:
+async def app_exception_handler(request: Request, exc: AppException) -> Response:
     """Handle custom application exceptions"""
     logger.error(f"Application exception: {exc.detail}", extra={
         "status_code": exc.status_code,
         "error_code": exc.error_code,
         "path": request.url.path,
         "method": request.method,
-        "client_ip": request.client.host if request.client else None
+        "client_ip": getattr(request.state, "client_ip", None)
     })
     
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={
-            "error": {
-                "code": exc.error_code,
-                "message": exc.detail,
-                "timestamp": str(request.state.timestamp) if hasattr(request.state, 'timestamp') else None
-            }
-        }
+    return _error_response(
+        exc.status_code, exc.error_code, exc.detail,
+        getattr(request.state, "ts_ns", None)
     )
 
-async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+async def validation_exception_handler(request: Request, exc: RequestValidationError) -> ORJSONResponse:
     """Handle validation errors"""
     logger.warning(f"Validation error: {exc.errors()}", extra={
         "path": request.url.path,
         "method": request.method,
-        "client_ip": request.client.host if request.client else None
+        "client_ip": getattr(request.state, "client_ip", None)
     })
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": {
                 "code": "VALIDATION_ERROR",
                 "message": "Validation failed",
                 "details": exc.errors(),
-                "timestamp": str(request.state.timestamp) if hasattr(request.state, 'timestamp') else None
+                "timestamp": getattr(request.state, "ts_ns", None)
             }
         }
     )
 
-async def python_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def python_exception_handler(request: Request, exc: Exception) -> Response:
     """Handle unexpected Python exceptions"""
     logger.error(f"Unexpected error: {str(exc)}", exc_info=True, extra={
         "path": request.url.path,
         "method": request.method,
-        "client_ip": request.client.host if request.client else None
+        "client_ip": getattr(request.state, "client_ip", None)
     })
     
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "error": {
-                "code": "INTERNAL_ERROR",
-                "message": "An unexpected error occurred",
-                "timestamp": str(request.state.timestamp) if hasattr(request.state, 'timestamp') else None
-            }
-        }
+    return _error_response(
+        status.HTTP_500_INTERNAL_SERVER_ERROR, "INTERNAL_ERROR",
+        "An unexpected error occurred",
+        getattr(request.state, "ts_ns", None)
     )
 
+class _LazyHeaders:
+    """Defers the full header-dict copy until the log record is rendered
+
+    Records that never pass a level filter never pay for dict(headers);
+    repr only runs during format, mirroring stdlib lazy %-formatting.
+    """
+    __slots__ = ("h",)
+
+    def __init__(self, h):
+        self.h = h
+
+    def __repr__(self):
+        return repr(dict(self.h))
+
 def log_request_info(request: Request) -> Dict[str, Any]:
     """Log request information for debugging"""
     return {
         "method": request.method,
         "url": str(request.url),
-        "headers": dict(request.headers),
-        "client_ip": request.client.host if request.client else None,
+        "headers": _LazyHeaders(request.headers),
+        "client_ip": getattr(request.state, "client_ip", None),
         "user_agent": request.headers.get("user-agent"),
         "content_length": request.headers.get("content-length"),
     } 
\ No newline at end of file
@@ -1,41 +1,111 @@
+import atexit
+import functools
 import logging
 import logging.handlers
 import os
+import queue
 import sys
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 from typing import Dict, Any
-import json
+import orjson
 from pathlib import Path
 
+# Bound once at import so format() does no flag-OR arithmetic or kwargs
+# rebuilding per record
+_JSON_OPTS = orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC
+
+def _json_default(o):
+    if isinstance(o, Exception):
+        return repr(o)
+    return str(o)
+
+_dumps = orjson.dumps
+
+# Static JSON fragments for per-record assembly; the fixed keys never hit a
+# dict build or key serialization at runtime
+_F_TS = b'{"timestamp":'
+_F_LEVEL = b',"level":"'
+_F_LOGGER = b'","logger":"'
+_F_MESSAGE = b'","message":'
+_F_MODULE = b',"module":"'
+_F_FUNCTION = b'","function":"'
+_F_LINE = b'","line":'
+_F_EXTRA = b',"extra":'
+_F_EXCEPTION = b',"exception":'
+
 class StructuredFormatter(logging.Formatter):
     """Custom formatter for structured logging"""
     
     def format(self, record: logging.LogRecord) -> str:
-        # Create structured log entry
-        log_entry = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "level": record.levelname,
-            "logger": record.name,
-            "message": record.getMessage(),
-            "module": record.module,
-            "function": record.funcName,
-            "line": record.lineno,
-        }
-        
-        # Add extra fields if present
-        if hasattr(record, 'extra_fields'):
-            log_entry.update(record.extra_fields)
-        
+        # Splice precompiled key fragments around orjson-encoded values:
+        # no intermediate dict, no per-record key encoding. levelname,
+        # logger name, module and funcName are controlled identifiers and
+        # need no JSON escaping; message and context go through orjson.
+        # Context fields stay nested under "extra" so they can't shadow
+        # the base keys.
+        message = record.msg if not record.args else record.getMessage()
+        # Stamp from record.created: with the queue listener, format()
+        # runs on the drain thread, so a fresh clock read here would
+        # record drain time and disagree with the console handler's
+        # rendering of the same record
+        buf = (
+            _F_TS
+            + _dumps(
+                datetime.fromtimestamp(record.created, tz=timezone.utc),
+                option=_JSON_OPTS,
+            )
+            + _F_LEVEL + record.levelname.encode()
+            + _F_LOGGER + record.name.encode()
+            + _F_MESSAGE + _dumps(message, default=_json_default)
+            + _F_MODULE + record.module.encode()
+            + _F_FUNCTION + record.funcName.encode()
+            + _F_LINE + b"%d" % record.lineno
+        )
+
+        extra_fields = getattr(record, "extra_fields", None)
+        if extra_fields:
+            buf += _F_EXTRA + _dumps(
+                extra_fields, option=_JSON_OPTS, default=_json_default
+            )
+
         # Add exception info if present
         if record.exc_info:
-            log_entry["exception"] = self.formatException(record.exc_info)
-        
-        return json.dumps(log_entry)
+            buf += _F_EXCEPTION + _dumps(self.formatException(record.exc_info))
+
+        # orjson emits UTF-8, not ASCII-escaped JSON, so decode as utf-8
+        return (buf + b"}").decode("utf-8")
+
+# Single shared formatter; all handlers format identically, and any cached
+# state (option masks, key layout) lives on one instance
+_STRUCTURED_FORMATTER = StructuredFormatter()
+
+class FastRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler without per-emit stat calls (CPython gh-105887)
+
+    The stdlib shouldRollover re-stats the log file on every emit. We cache
+    the is-regular-file check at open time and compare the stream position
+    against maxBytes directly, so the steady-state path makes no syscalls.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._is_regular_file = os.path.isfile(self.baseFilename)
+
+    def shouldRollover(self, record):
+        if self.maxBytes <= 0 or not self._is_regular_file:
+            return 0
+        if self.stream is None:
+            self.stream = self._open()
+        msg = "%s\n" % self.format(record)
+        if self.stream.tell() + len(msg) >= self.maxBytes:
+            return 1
+        return 0
 
 class CustomLogger:
     """Custom logger with structured logging and file rotation"""
     
-    def __init__(self, name: str = "web_scraper"):
+    def __init__(self, name: str = "web_scraper", enable_console: bool = None):
         self.logger = logging.getLogger(name)
         self.logger.setLevel(logging.INFO)
         
@@ -43,98 +113,119 @@ class CustomLogger:
         if self.logger.handlers:
             return
             
-        self._setup_handlers()
+        if enable_console is None:
+            enable_console = os.environ.get("LOG_CONSOLE", "1") == "1"
+        self._setup_handlers(enable_console)
     
-    def _setup_handlers(self):
+    def _setup_handlers(self, enable_console: bool = True):
         """Setup logging handlers"""
+        # Module singleton serves every handler; a single JSON format
+        # pass per record, no parallel human-formatted line
+        structured_formatter = _STRUCTURED_FORMATTER
+
+        if enable_console:
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setLevel(logging.INFO)
+            console_handler.setFormatter(structured_formatter)
+            self.logger.addHandler(console_handler)
+
+        # Containers log to stdout only; the aggregator owns persistence,
+        # so skip the file handlers and the listener thread entirely
+        if os.environ.get("LOG_TO_STDOUT_ONLY") == "1":
+            return
+
         # Create logs directory if it doesn't exist
         log_dir = Path("logs")
         log_dir.mkdir(exist_ok=True)
-        
-        # Console Handler (INFO and above)
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.INFO)
-        console_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        console_handler.setFormatter(console_formatter)
-        
-        # File Handler - General logs (INFO and above)
-        general_handler = logging.handlers.RotatingFileHandler(
-            log_dir / "web_scraper.log",
-            maxBytes=10 * 1024 * 1024,  # 10MB
-            backupCount=5
+
+        # File Handler - Full logs (DEBUG and above). This is the single
+        # complete sink; the old web_scraper.log duplicated every record
+        # already written here, doubling format and write work per message.
+        debug_handler = FastRotatingFileHandler(
+            log_dir / "debug.log",
+            maxBytes=20 * 1024 * 1024,  # 20MB
+            backupCount=2
         )
-        general_handler.setLevel(logging.INFO)
-        general_formatter = StructuredFormatter()
-        general_handler.setFormatter(general_formatter)
-        
+        debug_handler.setLevel(logging.DEBUG)
+        debug_handler.setFormatter(structured_formatter)
+
         # File Handler - Error logs (ERROR and above)
-        error_handler = logging.handlers.RotatingFileHandler(
+        error_handler = FastRotatingFileHandler(
             log_dir / "errors.log",
             maxBytes=5 * 1024 * 1024,  # 5MB
             backupCount=3
         )
         error_handler.setLevel(logging.ERROR)
-        error_formatter = StructuredFormatter()
-        error_handler.setFormatter(error_formatter)
-        
-        # File Handler - Debug logs (DEBUG and above)
-        debug_handler = logging.handlers.RotatingFileHandler(
-            log_dir / "debug.log",
-            maxBytes=20 * 1024 * 1024,  # 20MB
-            backupCount=2
+        error_handler.setFormatter(structured_formatter)
+
+        # File I/O runs on a listener thread: emitting coroutines only
+        # enqueue the record, so formatting and disk writes never block
+        # the event loop
+        log_queue = queue.SimpleQueue()
+        self._listener = logging.handlers.QueueListener(
+            log_queue, error_handler, debug_handler, respect_handler_level=True
         )
-        debug_handler.setLevel(logging.DEBUG)
-        debug_formatter = StructuredFormatter()
-        debug_handler.setFormatter(debug_formatter)
-        
-        # Add handlers to logger
-        self.logger.addHandler(console_handler)
-        self.logger.addHandler(general_handler)
-        self.logger.addHandler(error_handler)
-        self.logger.addHandler(debug_handler)
+        self._listener.start()
+        atexit.register(self._listener.stop)
+
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
-    def log_with_context(self, level: int, message: str, **kwargs):
+    def log_with_context(self, level: int, message: str, stacklevel: int = 2, **kwargs):
         """Log with additional context"""
-        extra_fields = kwargs.copy()
-        record = self.logger.makeRecord(
-            self.logger.name, level, "", 0, message, (), None
+        # Skip record construction entirely for filtered levels
+        if not self.logger.isEnabledFor(level):
+            return
+        # kwargs is already a fresh dict owned by this call; hand it to the
+        # stdlib record path directly. stacklevel makes module/funcName/
+        # lineno point at the caller: 2 for direct calls, 3 when routed
+        # through the level wrappers below.
+        self.logger.log(
+            level, message, extra={"extra_fields": kwargs}, stacklevel=stacklevel
         )
-        record.extra_fields = extra_fields
-        self.logger.handle(record)
     
     def info(self, message: str, **kwargs):
         """Log info message with context"""
-        self.log_with_context(logging.INFO, message, **kwargs)
+        self.log_with_context(logging.INFO, message, stacklevel=3, **kwargs)
     
     def warning(self, message: str, **kwargs):
         """Log warning message with context"""
-        self.log_with_context(logging.WARNING, message, **kwargs)
+        self.log_with_context(logging.WARNING, message, stacklevel=3, **kwargs)
     
     def error(self, message: str, **kwargs):
         """Log error message with context"""
-        self.log_with_context(logging.ERROR, message, **kwargs)
+        self.log_with_context(logging.ERROR, message, stacklevel=3, **kwargs)
     
     def debug(self, message: str, **kwargs):
         """Log debug message with context"""
-        self.log_with_context(logging.DEBUG, message, **kwargs)
+        self.log_with_context(logging.DEBUG, message, stacklevel=3, **kwargs)
     
     def critical(self, message: str, **kwargs):
         """Log critical message with context"""
-        self.log_with_context(logging.CRITICAL, message, **kwargs)
+        self.log_with_context(logging.CRITICAL, message, stacklevel=3, **kwargs)
 
 def setup_logging(name: str = "web_scraper") -> CustomLogger:
     """Setup and return a configured logger"""
     return CustomLogger(name)
 
+@functools.lru_cache(maxsize=None)
 def get_logger(name: str = "web_scraper") -> CustomLogger:
-    """Get a logger instance"""
+    """Get a logger instance (one CustomLogger per name)"""
     return CustomLogger(name)
 
 # Global logger instance
 logger = setup_logging()
 
+def _find_header(headers, key):
+    """First matching header value from raw ASGI header pairs
+
+    Short-circuits on the first hit instead of copying every header into a
+    dict just to read one key.
+    """
+    for k, v in headers:
+        if k == key:
+            return v
+    return b""
+
 # Logging middleware for FastAPI
 class LoggingMiddleware:
     """Middleware to log all requests and responses"""
@@ -142,54 +233,67 @@ class LoggingMiddleware:
     def __init__(self, app):
         self.app = app
         self.logger = get_logger("http")
+        # Bind the hot log path once so each request skips two attribute
+        # lookups per emitted record
+        self._log = self.logger.log_with_context
+        self._info = logging.INFO
     
     async def __call__(self, scope, receive, send):
-        if scope["type"] == "http":
-            # Log request
-            start_time = datetime.utcnow()
-            self.logger.info(
-                f"Request started: {scope['method']} {scope['path']}",
-                method=scope["method"],
-                path=scope["path"],
-                client_ip=scope.get("client", [None, None])[0],
-                user_agent=dict(scope.get("headers", [])).get(b"user-agent", b"").decode(),
-                timestamp=start_time.isoformat()
-            )
-            
-            # Process request
+        if scope["type"] != "http":
+            # Lifespan and websocket scopes must reach the app untouched;
+            # dropping them here kept the startup/shutdown events (client
+            # pools, DB init, the clock ticker) from ever running
             await self.app(scope, receive, send)
-            
-            # Log response
-            end_time = datetime.utcnow()
-            duration = (end_time - start_time).total_seconds()
-            self.logger.info(
-                f"Request completed: {scope['method']} {scope['path']}",
-                method=scope["method"],
-                path=scope["path"],
-                duration=duration,
-                timestamp=end_time.isoformat()
-            )
+            return
+        # Stash client_ip / request timestamp once; exception handlers
+        # read them from request.state instead of re-deriving per error
+        state = scope.setdefault("state", {})
+        state["client_ip"] = scope.get("client", (None,))[0]
+        state["ts_ns"] = time.time_ns()
+        # Log request; the formatter stamps records itself, so no
+        # datetime allocation or isoformat() on the request path
+        start = time.perf_counter()
+        self._log(
+            self._info,
+            f"Request started: {scope['method']} {scope['path']}",
+            method=scope["method"],
+            path=scope["path"],
+            client_ip=scope.get("client", [None, None])[0],
+            user_agent=_find_header(scope.get("headers", ()), b"user-agent").decode("latin-1")
+        )
+        
+        # Process request
+        await self.app(scope, receive, send)
+        
+        # Log response
+        duration = time.perf_counter() - start
+        self._log(
+            self._info,
+            f"Request completed: {scope['method']} {scope['path']}",
+            method=scope["method"],
+            path=scope["path"],
+            duration=duration
+        )
 
 # Performance logging decorator
 def log_performance(func):
     """Decorator to log function performance"""
     def wrapper(*args, **kwargs):
-        start_time = datetime.utcnow()
+        start = time.perf_counter()
         try:
             result = func(*args, **kwargs)
-            end_time = datetime.utcnow()
-            duration = (end_time - start_time).total_seconds()
-            
-            logger.info(
-                f"Function {func.__name__} completed successfully",
-                function=func.__name__,
-                duration=duration,
-                status="success"
-            )
+            # Success logging is the per-call hot path; skip the duration
+            # math and f-string entirely when INFO is filtered out
+            if logger.logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    f"Function {func.__name__} completed successfully",
+                    function=func.__name__,
+                    duration=time.perf_counter() - start,
+                    status="success"
+                )
             return result
         except Exception as e:
-            end_time = datetime.utcnow()
-            duration = (end_time - start_time).total_seconds()
+            duration = time.perf_counter() - start
             
             logger.error(
                 f"Function {func.__name__} failed",
@@ -206,22 +310,19 @@ def log_performance(func):
 def log_async_performance(func):
     """Decorator to log async function performance"""
     async def wrapper(*args, **kwargs):
-        start_time = datetime.utcnow()
+        start = time.perf_counter()
         try:
             result = await func(*args, **kwargs)
-            end_time = datetime.utcnow()
-            duration = (end_time - start_time).total_seconds()
-            
-            logger.info(
-                f"Async function {func.__name__} completed successfully",
-                function=func.__name__,
-                duration=duration,
-                status="success"
-            )
+            if logger.logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    f"Async function {func.__name__} completed successfully",
+                    function=func.__name__,
+                    duration=time.perf_counter() - start,
+                    status="success"
+                )
             return result
         except Exception as e:
-            end_time = datetime.utcnow()
-            duration = (end_time - start_time).total_seconds()
+            duration = time.perf_counter() - start
             
             logger.error(
                 f"Async function {func.__name__} failed",
@@ -5,20 +5,47 @@ Enhanced Web Scraper with improved URL handling and data extraction
 
 import asyncio
 import aiohttp
-from bs4 import BeautifulSoup, Comment
-import json
+import concurrent.futures
+import os
+from bs4 import BeautifulSoup, Comment, SoupStrainer
+import functools
+import itertools
+import orjson
+import random
 import time
 import re
 from datetime import datetime, timezone
-from urllib.parse import urljoin, urlparse, urlunparse
-from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import urljoin, urlparse, urlsplit, urlunparse
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
 import logging
+import lxml.etree
+import lxml.html
+import soupsieve
 from dataclasses import dataclass
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Only the tags the extractors actually read get materialized at parse
+# time. nav/footer/header/div stay in so the decompose cleanup and the
+# .content/#content main selectors keep their structure — with parse_only,
+# a dropped ancestor would flatten its matching children back into the
+# tree instead of removing them.
+_STRAINED_TAGS = frozenset((
+    'title', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'ul', 'ol', 'li',
+    'table', 'tr', 'td', 'th', 'a', 'img', 'video', 'source', 'meta',
+    'main', 'article', 'div', 'nav', 'footer', 'header',
+))
+
+def _strainer_match(name, attrs):
+    if name == 'script':
+        # JSON-LD payloads are the only scripts worth keeping
+        return attrs.get('type') == 'application/ld+json'
+    return name in _STRAINED_TAGS
+
+PARSE_STRAINER = SoupStrainer(_strainer_match)
+
 @dataclass
 class ScrapingConfig:
     """Configuration for scraping operations"""
@@ -38,13 +65,32 @@ class ScrapingConfig:
                 r'\.jpg$', r'\.jpeg$', r'\.png$', r'\.gif$', r'\.bmp$', r'\.svg$',
                 r'mailto:', r'tel:', r'ftp:', r'javascript:'
             ]
+        # One alternation compiled once: a single C-level scan per URL
+        # instead of ~20 Python-level re.search calls
+        self.exclude_re = re.compile(
+            '(?:' + '|'.join(self.exclude_patterns) + ')', re.IGNORECASE
+        )
+
+# ASCII A-Z to a-z in one C translate pass; hostnames are ASCII except
+# IDN, which falls back to full str.lower case folding
+_LOWER_TABLE = bytes.maketrans(bytes(range(65, 91)), bytes(range(97, 123)))
+
+def _lower_ascii(s: str) -> str:
+    if s.isascii():
+        return s.encode().translate(_LOWER_TABLE).decode()
+    return s.lower()
 
 class URLProcessor:
     """Handles URL validation, normalization, and filtering"""
     
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def normalize_url(url: str) -> str:
-        """Normalize URL by removing fragments, sorting params, etc."""
+        """Normalize URL by removing fragments, sorting params, etc.
+
+        Pure function of the input string, so repeats across a crawl
+        (every page linking home, for instance) hit the cache.
+        """
         try:
             parsed = urlparse(url.strip())
             
@@ -56,7 +102,7 @@ class URLProcessor:
                 parsed = parsed._replace(scheme='https')
             
             # Normalize netloc (domain)
-            netloc = parsed.netloc.lower()
+            netloc = _lower_ascii(parsed.netloc)
             if netloc.startswith('www.') and len(netloc) > 4:
                 # Remove www. prefix for consistency
                 netloc = netloc[4:]
@@ -74,6 +120,7 @@ class URLProcessor:
             return url
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def is_valid_url(url: str, base_domain: str = None) -> bool:
         """Check if URL is valid and should be scraped"""
         try:
@@ -89,7 +136,7 @@ class URLProcessor:
             
             # If base_domain specified, must be same domain
             if base_domain:
-                url_domain = parsed.netloc.lower()
+                url_domain = _lower_ascii(parsed.netloc)
                 if url_domain.startswith('www.'):
                     url_domain = url_domain[4:]
                 if url_domain != base_domain:
@@ -100,42 +147,161 @@ class URLProcessor:
             return False
 
     @staticmethod
-    def should_exclude_url(url: str, exclude_patterns: List[str]) -> bool:
-        """Check if URL matches exclusion patterns"""
-        for pattern in exclude_patterns:
-            if re.search(pattern, url, re.IGNORECASE):
-                return True
-        return False
+    def should_exclude_url(url: str, exclude_re: 're.Pattern') -> bool:
+        """Check if URL matches the compiled exclusion pattern"""
+        return bool(exclude_re.search(url))
+
+_HEADING_TAGS = frozenset(('h1', 'h2', 'h3', 'h4', 'h5', 'h6'))
+
+def to_json(result: Dict) -> bytes:
+    """Serialize a scrape result to JSON bytes via orjson"""
+    return orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS)
+
+def _fastjoin(base_split, base_url: str, src: str) -> str:
+    """urljoin for the common URL shapes without re-parsing the base
+
+    urljoin re-parses base_url on every call; absolute, protocol-relative
+    and root-relative references cover nearly all real link/media sources
+    and resolve with pure string ops against the pre-split base.
+    """
+    if src.startswith(('http://', 'https://')):
+        return src
+    if src.startswith('//'):
+        return base_split.scheme + ':' + src
+    if src.startswith('/'):
+        return f"{base_split.scheme}://{base_split.netloc}{src}"
+    return urljoin(base_url, src)
+
+def _netloc(url: str) -> str:
+    """Host portion of an already-normalized URL
+
+    Two str.find calls instead of a full urlparse + SplitResult
+    allocation; extract_links runs this once per link.
+    """
+    i = url.find('://')
+    if i == -1:
+        return ''
+    i += 3
+    j = url.find('/', i)
+    return url[i:] if j == -1 else url[i:j]
+
+# Precompiled XPaths for the hot iteration loops; evaluating these on the
+# lxml tree stays in C instead of walking bs4's Python object tree
+_A_XP = lxml.etree.XPath('.//a[@href]')
+_IMG_XP = lxml.etree.XPath('.//img[@src]')
+_META_XP = lxml.etree.XPath('.//meta')
+_VIDEO_XP = lxml.etree.XPath('.//video')
+_SOURCE_XP = lxml.etree.XPath('.//source[@src]')
+
+# Compiled once; select_one re-parses the selector string on every call
+_MAIN_SELECTOR = soupsieve.compile(
+    'main, article, .content, .main-content, #content, #main'
+)
+
+# Same selector union as XPath; "[1]" makes lxml stop at the first match
+# in document order instead of collecting every candidate
+_MAIN_XPATH = lxml.etree.XPath(
+    '(//main | //article'
+    ' | //*[contains(concat(" ",normalize-space(@class)," ")," content ")]'
+    ' | //*[contains(concat(" ",normalize-space(@class)," ")," main-content ")]'
+    ' | //*[@id="content"] | //*[@id="main"])[1]'
+)
+
+# Compiled once; clean_text runs per extracted text node
+_WS_RE = re.compile(r'\s+')
+_SKIP_RE = re.compile(
+    '|'.join((
+        r'^(skip to|jump to|go to)\s+\w+',
+        r'^(home|about|contact|privacy|terms)\s*$',
+        r'^\s*(©|copyright)\s*\d{4}',
+        r'^(follow us|connect with us)',
+    )),
+    re.IGNORECASE
+)
+
+def _collapse(fragments) -> str:
+    """Join text fragments with single spaces, collapsing inner runs
+
+    Streams tag-boundary fragments (bs4 stripped_strings or lxml
+    itertext) instead of concatenating the full subtree text and
+    regex-normalizing the copy afterwards.
+    """
+    return ' '.join(
+        ' '.join(t.split()) for t in fragments if t and not t.isspace()
+    )
+
+def _drop_boilerplate(text: str) -> str:
+    """Blank out navigation/footer boilerplate, keep everything else"""
+    if len(text) < 3:
+        return text
+    return "" if _SKIP_RE.match(text) else text
 
 class ContentExtractor:
     """Enhanced content extraction with better data quality"""
+
+    @staticmethod
+    def element_text(el) -> str:
+        """clean_text for a bs4 element, without the get_text round trip"""
+        return _drop_boilerplate(_collapse(el.stripped_strings))
     
     @staticmethod
     def clean_text(text: str) -> str:
         """Clean and normalize text content"""
         if not text:
             return ""
-        
+
+        # Short cell/link fragments can't match any skip pattern and hold
+        # no inner whitespace worth collapsing — skip the regexes entirely
+        if len(text) < 3:
+            return text.strip()
+
         # Remove extra whitespace and normalize
-        text = re.sub(r'\s+', ' ', text.strip())
-        
-        # Remove common navigation/footer text patterns
-        skip_patterns = [
-            r'^(skip to|jump to|go to)\s+\w+',
-            r'^(home|about|contact|privacy|terms)\s*$',
-            r'^\s*(©|copyright)\s*\d{4}',
-            r'^(follow us|connect with us)',
-        ]
-        
-        for pattern in skip_patterns:
-            if re.match(pattern, text, re.IGNORECASE):
-                return ""
-        
-        return text
+        text = _WS_RE.sub(' ', text.strip())
+        if not text:
+            return ""
+
+        # Drop common navigation/footer text patterns
+        return "" if _SKIP_RE.match(text) else text
 
     @staticmethod
-    def extract_structured_data(soup: BeautifulSoup) -> Dict:
-        """Extract structured data (JSON-LD, microdata, etc.)"""
+    def extract_meta(tree) -> Tuple[Dict, Dict, Dict]:
+        """Extract all meta tags in one pass over the lxml tree
+
+        Returns (meta_data, open_graph, twitter). One precompiled XPath
+        dispatching on attribute prefixes replaces three separate bs4
+        scans, two of which called a Python lambda per element.
+        """
+        meta_data = {}
+        og_data = {}
+        twitter_data = {}
+        for meta in _META_XP(tree):
+            attrs = meta.attrib
+            content = attrs.get('content')
+            if not content:
+                continue
+            prop = attrs.get('property', '')
+            if prop.startswith('og:'):
+                og_data[prop[3:]] = content
+                meta_data[prop.lower()] = content
+                continue
+            name = attrs.get('name', '')
+            if name.startswith('twitter:'):
+                twitter_data[name[8:]] = content
+                meta_data[name.lower()] = content
+                continue
+            key = name or prop or attrs.get('http-equiv')
+            if key:
+                meta_data[key.lower()] = content
+        return meta_data, og_data, twitter_data
+
+    @staticmethod
+    def extract_structured_data(soup: BeautifulSoup, og_data: Dict = None,
+                                twitter_data: Dict = None) -> Dict:
+        """Extract structured data (JSON-LD, microdata, etc.)
+
+        Open Graph / Twitter dicts come pre-collected from extract_meta
+        so the meta tags are only walked once per page.
+        """
         structured_data = {}
         
         # JSON-LD
@@ -143,41 +309,30 @@ class ContentExtractor:
         json_ld_data = []
         for script in json_ld_scripts:
             try:
-                data = json.loads(script.string)
+                data = orjson.loads(script.string)
                 json_ld_data.append(data)
-            except (json.JSONDecodeError, AttributeError):
+            except (orjson.JSONDecodeError, AttributeError, TypeError):
                 continue
         
         if json_ld_data:
             structured_data['json_ld'] = json_ld_data
         
-        # Open Graph
-        og_data = {}
-        for meta in soup.find_all('meta', property=lambda x: x and x.startswith('og:')):
-            prop = meta.get('property', '')[3:]  # Remove 'og:' prefix
-            content = meta.get('content', '')
-            if prop and content:
-                og_data[prop] = content
-        
         if og_data:
             structured_data['open_graph'] = og_data
         
-        # Twitter Cards
-        twitter_data = {}
-        for meta in soup.find_all('meta', attrs={'name': lambda x: x and x.startswith('twitter:')}):
-            name = meta.get('name', '')[8:]  # Remove 'twitter:' prefix
-            content = meta.get('content', '')
-            if name and content:
-                twitter_data[name] = content
-        
         if twitter_data:
             structured_data['twitter'] = twitter_data
         
         return structured_data
 
     @staticmethod
-    def extract_main_content(soup: BeautifulSoup) -> Dict:
-        """Extract main content areas with better quality"""
+    def extract_main_content(soup: BeautifulSoup, tree=None) -> Dict:
+        """Extract main content areas with better quality
+
+        When the raw lxml tree is supplied, the main-content area comes
+        from one precompiled XPath union over it instead of a soupsieve
+        walk of the bs4 tree.
+        """
         content = {
             'title': '',
             'headings': [],
@@ -190,49 +345,73 @@ class ContentExtractor:
         # Title
         title_tag = soup.find('title')
         if title_tag:
-            content['title'] = ContentExtractor.clean_text(title_tag.get_text())
+            content['title'] = ContentExtractor.element_text(title_tag)
         
         # Alternative title sources
         if not content['title']:
             h1 = soup.find('h1')
             if h1:
-                content['title'] = ContentExtractor.clean_text(h1.get_text())
+                content['title'] = ContentExtractor.element_text(h1)
         
         # Remove script, style, and comment elements
         for element in soup(['script', 'style', 'nav', 'footer', 'header']):
             element.decompose()
-        
+
+        # One walk over the tree replaces the dozen find_all sub-walks:
+        # collect element references (and comments) in a single pass, then
+        # read text afterwards so comment removal still precedes get_text
+        heading_tags = []
+        paragraph_tags = []
+        list_tags = []
+        table_tags = []
+        comments = []
+        for el in soup.descendants:
+            name = el.name
+            if name is None:
+                if isinstance(el, Comment):
+                    comments.append(el)
+            elif name == 'p':
+                paragraph_tags.append(el)
+            elif name in _HEADING_TAGS:
+                heading_tags.append(el)
+            elif name == 'ul' or name == 'ol':
+                list_tags.append(el)
+            elif name == 'table':
+                table_tags.append(el)
+
         # Remove comments
-        for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
+        for comment in comments:
             comment.extract()
-        
+
         # Extract headings with hierarchy
         headings = []
-        for level in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-            for heading in soup.find_all(level):
-                text = ContentExtractor.clean_text(heading.get_text())
-                if text and len(text.split()) >= 2:  # At least 2 words
-                    headings.append({
-                        'level': int(level[1]),
-                        'text': text,
-                        'tag': level
-                    })
+        for heading in heading_tags:
+            text = ContentExtractor.element_text(heading)
+            if text and len(text.split()) >= 2:  # At least 2 words
+                headings.append({
+                    'level': int(heading.name[1]),
+                    'text': text,
+                    'tag': heading.name
+                })
         content['headings'] = headings
-        
+
         # Extract paragraphs with quality filtering
         paragraphs = []
-        for p in soup.find_all('p'):
-            text = ContentExtractor.clean_text(p.get_text())
+        for p in paragraph_tags:
+            text = ContentExtractor.element_text(p)
             if text and len(text) > 30 and len(text.split()) >= 5:  # Quality filter
                 paragraphs.append(text)
         content['paragraphs'] = paragraphs
-        
-        # Extract lists
+
+        # Extract lists; direct-child iteration keeps nested lists from
+        # duplicating their items into every ancestor list
         lists = []
-        for ul in soup.find_all(['ul', 'ol']):
+        for ul in list_tags:
             list_items = []
-            for li in ul.find_all('li'):
-                item_text = ContentExtractor.clean_text(li.get_text())
+            for li in ul.children:
+                if li.name != 'li':
+                    continue
+                item_text = ContentExtractor.element_text(li)
                 if item_text:
                     list_items.append(item_text)
             if list_items:
@@ -241,131 +420,157 @@ class ContentExtractor:
                     'items': list_items
                 })
         content['lists'] = lists
-        
-        # Extract tables
+
+        # Extract tables via local child iteration (the strainer drops
+        # thead/tbody, so rows sit directly under the table)
         tables = []
-        for table in soup.find_all('table'):
+        for table in table_tags:
             rows = []
-            for tr in table.find_all('tr'):
+            for tr in table.descendants:
+                if tr.name != 'tr':
+                    continue
                 cells = []
-                for cell in tr.find_all(['td', 'th']):
-                    cell_text = ContentExtractor.clean_text(cell.get_text())
-                    cells.append(cell_text)
+                for cell in tr.children:
+                    if cell.name == 'td' or cell.name == 'th':
+                        cells.append(ContentExtractor.element_text(cell))
                 if cells:
                     rows.append(cells)
             if rows:
                 tables.append({'rows': rows})
         content['tables'] = tables
         
-        # Extract main content area
-        main_selectors = ['main', 'article', '.content', '.main-content', '#content', '#main']
+        # Extract main content area; a single first-match query replaces
+        # one walk per candidate selector. The tree arrives with
+        # script/style/nav/footer/header already stripped (mirroring the
+        # soup decompose above), so a matched container that wraps page
+        # chrome yields the same text on either path
         main_content = ''
-        for selector in main_selectors:
-            main_elem = soup.select_one(selector)
-            if main_elem:
-                main_content = ContentExtractor.clean_text(main_elem.get_text())
-                break
+        if tree is not None:
+            matches = _MAIN_XPATH(tree)
+            if matches:
+                main_content = _drop_boilerplate(_collapse(matches[0].itertext()))
+        else:
+            main_elem = _MAIN_SELECTOR.select_one(soup)
+            if main_elem is not None:
+                main_content = ContentExtractor.element_text(main_elem)
         
         if not main_content:
             # Fallback: get all paragraph text
             main_content = ' '.join(content['paragraphs'][:5])  # First 5 paragraphs
         
         content['main_content'] = main_content
-        
+
+        # Counters ride along with the extraction so downstream consumers
+        # (quality score, result assembly) never re-measure the lists
+        content['headings_count'] = len(headings)
+        content['paragraphs_count'] = len(paragraphs)
+        content['lists_count'] = len(lists)
+        content['tables_count'] = len(tables)
+
         return content
 
     @staticmethod
-    def extract_links(soup: BeautifulSoup, base_url: str) -> List[Dict]:
-        """Extract and categorize links"""
+    def extract_links(tree, base_url: str) -> List[Dict]:
+        """Extract and categorize links from the lxml tree"""
         links = []
+        # Hashes instead of full URL strings: 8 bytes per entry and one
+        # int compare per lookup; a false positive needs a 64-bit hash
+        # collision within a single page's links
         seen_urls = set()
-        
-        for a in soup.find_all('a', href=True):
-            href = a.get('href', '').strip()
+
+        # Parsed once per page, not once per link
+        base_split = urlsplit(base_url)
+        base_netloc = base_split.netloc
+
+        for a in _A_XP(tree):
+            href = (a.get('href') or '').strip()
             if not href or href.startswith('#'):
                 continue
             
             # Resolve relative URLs
             try:
-                full_url = urljoin(base_url, href)
+                full_url = _fastjoin(base_split, base_url, href)
                 full_url = URLProcessor.normalize_url(full_url)
             except Exception:
                 continue
             
             # Skip duplicates
-            if full_url in seen_urls:
+            h = hash(full_url)
+            if h in seen_urls:
                 continue
-            seen_urls.add(full_url)
+            seen_urls.add(h)
             
-            link_text = ContentExtractor.clean_text(a.get_text())
+            link_text = _drop_boilerplate(_collapse(a.itertext()))
             
             # Categorize link
-            parsed = urlparse(full_url)
-            base_parsed = urlparse(base_url)
+            netloc = _netloc(full_url)
             
             link_type = 'external'
-            if parsed.netloc == base_parsed.netloc:
+            if netloc == base_netloc:
                 link_type = 'internal'
-            elif not parsed.netloc:
+            elif not netloc:
                 link_type = 'relative'
             
             links.append({
                 'url': full_url,
                 'text': link_text,
-                'title': a.get('title', ''),
+                'title': a.get('title') or '',
                 'type': link_type,
-                'rel': a.get('rel', [])
+                'rel': (a.get('rel') or '').split()
             })
         
         return links
 
     @staticmethod
-    def extract_media(soup: BeautifulSoup, base_url: str) -> Dict:
-        """Extract images, videos, and other media"""
+    def extract_media(tree, base_url: str) -> Dict:
+        """Extract images, videos, and other media from the lxml tree"""
         media = {
             'images': [],
             'videos': [],
             'audio': []
         }
         
+        base_split = urlsplit(base_url)
+        
         # Images
-        for img in soup.find_all('img', src=True):
-            src = img.get('src', '').strip()
+        for img in _IMG_XP(tree):
+            src = (img.get('src') or '').strip()
             if not src:
                 continue
             
             try:
-                full_url = urljoin(base_url, src)
+                full_url = _fastjoin(base_split, base_url, src)
             except Exception:
                 continue
             
             media['images'].append({
                 'src': full_url,
-                'alt': img.get('alt', ''),
-                'title': img.get('title', ''),
+                'alt': img.get('alt') or '',
+                'title': img.get('title') or '',
                 'width': img.get('width'),
                 'height': img.get('height'),
-                'loading': img.get('loading', 'eager')
+                'loading': img.get('loading') or 'eager'
             })
         
         # Videos
-        for video in soup.find_all('video'):
+        for video in _VIDEO_XP(tree):
+            attrib = video.attrib
             video_data = {
                 'sources': [],
-                'poster': video.get('poster', ''),
-                'controls': video.has_attr('controls'),
-                'autoplay': video.has_attr('autoplay')
+                'poster': attrib.get('poster', ''),
+                'controls': 'controls' in attrib,
+                'autoplay': 'autoplay' in attrib
             }
             
             # Video sources
-            for source in video.find_all('source', src=True):
-                src = source.get('src', '').strip()
+            for source in _SOURCE_XP(video):
+                src = (source.get('src') or '').strip()
                 if src:
                     try:
-                        full_url = urljoin(base_url, src)
+                        full_url = _fastjoin(base_split, base_url, src)
                         video_data['sources'].append({
                             'src': full_url,
-                            'type': source.get('type', '')
+                            'type': source.get('type') or ''
                         })
                     except Exception:
                         continue
@@ -375,146 +580,266 @@ class ContentExtractor:
         
         return media
 
+# One session for the whole process: repeated scraper instances reuse the
+# connection pool instead of paying TLS+TCP handshakes per batch
+_shared_session: Optional[aiohttp.ClientSession] = None
+_session_lock = asyncio.Lock()
+
+async def get_shared_session(config: ScrapingConfig) -> aiohttp.ClientSession:
+    """Get (lazily creating) the process-wide ClientSession"""
+    global _shared_session
+    if _shared_session is None or _shared_session.closed:
+        async with _session_lock:
+            if _shared_session is None or _shared_session.closed:
+                # limit sits well above max_concurrent so the pool never
+                # caps throughput; the DNS cache avoids per-batch lookups
+                connector = aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=10,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=30
+                )
+                timeout = aiohttp.ClientTimeout(total=config.timeout)
+                _shared_session = aiohttp.ClientSession(
+                    connector=connector,
+                    timeout=timeout,
+                    headers={'User-Agent': config.user_agent}
+                )
+    return _shared_session
+
+async def close_shared_session():
+    """Close the shared session at application shutdown"""
+    global _shared_session
+    if _shared_session is not None and not _shared_session.closed:
+        await _shared_session.close()
+    _shared_session = None
+
+def _parse_html_bytes(html: bytes, normalized_url: str) -> Dict:
+    """Parse one page and run every extractor (executes in a pool worker)
+
+    Pure CPU work on plain bytes in, plain dicts out, so it pickles
+    cleanly across the process boundary.
+    """
+    try:
+        soup = BeautifulSoup(html, 'lxml', parse_only=PARSE_STRAINER)
+    except Exception:
+        soup = BeautifulSoup(html, 'html.parser', parse_only=PARSE_STRAINER)
+    tree = lxml.html.fromstring(html)
+    # Strip everything the soup path decomposes: script/style so their
+    # text can't leak into itertext, and nav/footer/header so links,
+    # media and main-content from the tree exclude chrome the same way
+    # the decomposed soup always has
+    lxml.etree.strip_elements(
+        tree, 'script', 'style', 'nav', 'footer', 'header', with_tail=False
+    )
+
+    content = ContentExtractor.extract_main_content(soup, tree)
+    links = ContentExtractor.extract_links(tree, normalized_url)
+    media = ContentExtractor.extract_media(tree, normalized_url)
+    meta_data, og_data, twitter_data = ContentExtractor.extract_meta(tree)
+    structured_data = ContentExtractor.extract_structured_data(
+        soup, og_data, twitter_data
+    )
+
+    # Cap main_content before it crosses the pickle boundary; only the
+    # first 1000 chars ever reach the result, so the full backing string
+    # dies with this worker call
+    main_text = content['main_content']
+    content['text_length'] = len(main_text)
+    content['main_content'] = main_text[:1000]
+    return {
+        'content': content,
+        'links': links,
+        'media': media,
+        'meta': meta_data,
+        'structured_data': structured_data,
+    }
+
+# Parse workers are shared process-wide, like the HTTP session: bs4 and
+# the extractors are pure CPU and would otherwise stall the event loop
+# between network reads
+_PARSE_POOL = None
+
+def _parse_pool() -> concurrent.futures.ProcessPoolExecutor:
+    global _PARSE_POOL
+    if _PARSE_POOL is None:
+        _PARSE_POOL = concurrent.futures.ProcessPoolExecutor(
+            max_workers=os.cpu_count()
+        )
+    return _PARSE_POOL
+
 class EnhancedWebScraper:
     """Enhanced web scraper with improved URL handling and data extraction"""
-    
-    def __init__(self, config: ScrapingConfig = None):
+
+    def __init__(self, config: ScrapingConfig = None, session: aiohttp.ClientSession = None):
         self.config = config or ScrapingConfig()
-        self.session = None
+        self.session = session
         self.visited_urls: Set[str] = set()
         self.failed_urls: Set[str] = set()
-    
+        # Per-host politeness state: unrelated hosts never wait on each
+        # other, so throughput scales with the number of distinct hosts
+        self._host_locks: Dict[str, asyncio.Lock] = {}
+        self._host_next_ts: Dict[str, float] = {}
+
     async def __aenter__(self):
         """Async context manager entry"""
-        connector = aiohttp.TCPConnector(limit=10, limit_per_host=5)
-        timeout = aiohttp.ClientTimeout(total=self.config.timeout)
-        
-        self.session = aiohttp.ClientSession(
-            connector=connector,
-            timeout=timeout,
-            headers={'User-Agent': self.config.user_agent}
-        )
+        if self.session is None:
+            self.session = await get_shared_session(self.config)
         return self
-    
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        if self.session:
-            await self.session.close()
+        # The session is shared (or caller-owned); it outlives this
+        # scraper and closes via close_shared_session() at shutdown
+        return None
     
-    async def scrape_url(self, url: str, retry_count: int = 0) -> Dict:
-        """Scrape a single URL with enhanced error handling"""
-        try:
-            normalized_url = URLProcessor.normalize_url(url)
+    async def _host_throttle(self, host: str):
+        """Space requests to one host by delay_between_requests"""
+        delay = self.config.delay_between_requests
+        if delay <= 0:
+            return
+        lock = self._host_locks.get(host)
+        if lock is None:
+            lock = self._host_locks.setdefault(host, asyncio.Lock())
+        loop = asyncio.get_running_loop()
+        async with lock:
+            wait = self._host_next_ts.get(host, 0.0) - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._host_next_ts[host] = loop.time() + delay
+
+    async def scrape_url(self, url: str, semaphore: asyncio.Semaphore = None) -> Dict:
+        """Scrape a single URL with enhanced error handling
+
+        Retries run in a bounded loop instead of recursion, so each
+        attempt reuses the same frame and the visited check happens once.
+        When a semaphore is passed it is only held for the request
+        itself — a backed-off URL sleeps without stalling its peers.
+        """
+        normalized_url = URLProcessor.normalize_url(url)
+
+        # Check if already visited or should be excluded
+        if normalized_url in self.visited_urls:
+            return {"error": "Already visited", "url": url}
+
+        if URLProcessor.should_exclude_url(normalized_url, self.config.exclude_re):
+            return {"error": "URL excluded by pattern", "url": url}
+
+        self.visited_urls.add(normalized_url)
+
+        host = _netloc(normalized_url)
+        last_error = "Unknown error"
+        for attempt in range(self.config.max_retries + 1):
+            # Wait out the per-host spacing before taking a concurrency
+            # slot, so a throttled host doesn't occupy the semaphore
+            await self._host_throttle(host)
+            try:
+                if semaphore is None:
+                    return await self._scrape_once(url, normalized_url)
+                async with semaphore:
+                    return await self._scrape_once(url, normalized_url)
+            except asyncio.TimeoutError:
+                last_error = "Timeout"
+                logger.warning(f"Timeout for {url}, retrying...")
+            except aiohttp.ClientError as e:
+                last_error = f"Client error: {str(e)}"
+                logger.warning(f"Client error for {url}: {e}, retrying...")
+            except Exception as e:
+                logger.error(f"Unexpected error scraping {url}: {str(e)}")
+                return {"error": f"Unexpected error: {str(e)}", "url": url}
+            if attempt < self.config.max_retries:
+                # Exponential backoff with jitter so retry storms don't
+                # synchronize; the semaphore is released while sleeping
+                await asyncio.sleep(2 ** attempt + random.random() * 0.1)
+
+        return {"error": last_error, "url": url}
+
+    async def _scrape_once(self, url: str, normalized_url: str) -> Dict:
+        """One request/parse attempt; retryable errors propagate"""
+        async with self.session.get(normalized_url) as response:
+            # Handle redirects
+            if response.history:
+                final_url = str(response.url)
+                logger.info(f"Redirected from {url} to {final_url}")
+                normalized_url = URLProcessor.normalize_url(final_url)
             
-            # Check if already visited or should be excluded
-            if normalized_url in self.visited_urls:
-                return {"error": "Already visited", "url": url}
+            # Check status
+            if response.status != 200:
+                error_msg = f"HTTP {response.status}"
+                if response.status == 404:
+                    error_msg = "Page not found"
+                elif response.status == 403:
+                    error_msg = "Access forbidden"
+                elif response.status == 500:
+                    error_msg = "Server error"
+                
+                return {"error": error_msg, "url": normalized_url, "status_code": response.status}
             
-            if URLProcessor.should_exclude_url(normalized_url, self.config.exclude_patterns):
-                return {"error": "URL excluded by pattern", "url": url}
+            # Stream the body: chunks accumulate while the socket is
+            # still receiving, and handing bytes straight to bs4's
+            # lxml builder (which detects the encoding itself) skips
+            # the full unicode copy response.text() would build
+            buf = bytearray()
+            async for chunk in response.content.iter_chunked(64 * 1024):
+                buf += chunk
+            html = bytes(buf)
             
-            self.visited_urls.add(normalized_url)
+            # Parsing and extraction are pure CPU; run them in the parse
+            # pool so this coroutine goes back to awaiting sockets while
+            # worker processes use the other cores
+            loop = asyncio.get_running_loop()
+            parsed = await loop.run_in_executor(
+                _parse_pool(), _parse_html_bytes, html, normalized_url
+            )
+            content = parsed['content']
+            links = parsed['links']
+            media = parsed['media']
+            meta_data = parsed['meta']
+            structured_data = parsed['structured_data']
             
-            # Make request with retry logic
-            async with self.session.get(normalized_url) as response:
-                # Handle redirects
-                if response.history:
-                    final_url = str(response.url)
-                    logger.info(f"Redirected from {url} to {final_url}")
-                    normalized_url = URLProcessor.normalize_url(final_url)
-                
-                # Check status
-                if response.status != 200:
-                    error_msg = f"HTTP {response.status}"
-                    if response.status == 404:
-                        error_msg = "Page not found"
-                    elif response.status == 403:
-                        error_msg = "Access forbidden"
-                    elif response.status == 500:
-                        error_msg = "Server error"
-                    
-                    return {"error": error_msg, "url": normalized_url, "status_code": response.status}
-                
-                # Get content
-                try:
-                    html = await response.text()
-                except UnicodeDecodeError:
-                    html = await response.text(encoding='utf-8', errors='ignore')
-                
-                # Parse with BeautifulSoup
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                # Extract all data
-                content = ContentExtractor.extract_main_content(soup)
-                links = ContentExtractor.extract_links(soup, normalized_url)
-                media = ContentExtractor.extract_media(soup, normalized_url)
-                structured_data = ContentExtractor.extract_structured_data(soup)
-                
-                # Enhanced metadata
-                meta_data = {}
-                for meta in soup.find_all('meta'):
-                    name = meta.get('name') or meta.get('property') or meta.get('http-equiv')
-                    content_attr = meta.get('content')
-                    if name and content_attr:
-                        meta_data[name.lower()] = content_attr
-                
-                # Calculate content quality score
-                quality_score = self._calculate_quality_score(content, len(html))
-                
-                # Parse domain info
-                parsed_url = urlparse(normalized_url)
-                
-                result = {
-                    "url": normalized_url,
-                    "original_url": url,
-                    "domain": parsed_url.netloc,
-                    "path": parsed_url.path,
-                    "title": content['title'],
-                    "headings": content['headings'],
-                    "paragraphs": content['paragraphs'],
-                    "lists": content['lists'],
-                    "tables": content['tables'],
-                    "main_content": content['main_content'][:1000],  # First 1000 chars
-                    "links": links,
-                    "media": media,
-                    "meta": meta_data,
-                    "structured_data": structured_data,
-                    "content_length": len(html),
-                    "text_length": len(content['main_content']),
-                    "quality_score": quality_score,
-                    "headings_count": len(content['headings']),
-                    "paragraphs_count": len(content['paragraphs']),
-                    "links_count": len(links),
-                    "images_count": len(media['images']),
-                    "videos_count": len(media['videos']),
-                    "lists_count": len(content['lists']),
-                    "tables_count": len(content['tables']),
-                    "scraped_at": datetime.now(timezone.utc).isoformat(),
-                    "response_time": time.time(),
-                    "status_code": response.status,
-                    "content_type": response.headers.get('content-type', ''),
-                    "last_modified": response.headers.get('last-modified', ''),
-                }
-                
-                return result
-                
-        except asyncio.TimeoutError:
-            if retry_count < self.config.max_retries:
-                logger.warning(f"Timeout for {url}, retrying...")
-                await asyncio.sleep(2 ** retry_count)  # Exponential backoff
-                return await self.scrape_url(url, retry_count + 1)
-            return {"error": "Timeout", "url": url}
-        
-        except aiohttp.ClientError as e:
-            if retry_count < self.config.max_retries:
-                logger.warning(f"Client error for {url}: {e}, retrying...")
-                await asyncio.sleep(2 ** retry_count)
-                return await self.scrape_url(url, retry_count + 1)
-            return {"error": f"Client error: {str(e)}", "url": url}
-        
-        except Exception as e:
-            logger.error(f"Unexpected error scraping {url}: {str(e)}")
-            return {"error": f"Unexpected error: {str(e)}", "url": url}
+            # Calculate content quality score
+            quality_score = self._calculate_quality_score(content, len(html))
+
+            # Bytes received per the header when present; saves measuring
+            # huge bodies and reflects what actually crossed the wire
+            content_length = response.content_length or len(html)
+            
+            # Parse domain info
+            parsed_url = urlparse(normalized_url)
+            
+            result = {
+                "url": normalized_url,
+                "original_url": url,
+                "domain": parsed_url.netloc,
+                "path": parsed_url.path,
+                "title": content['title'],
+                "headings": content['headings'],
+                "paragraphs": content['paragraphs'],
+                "lists": content['lists'],
+                "tables": content['tables'],
+                "main_content": content['main_content'],  # capped at 1000 chars
+                "links": links,
+                "media": media,
+                "meta": meta_data,
+                "structured_data": structured_data,
+                "content_length": content_length,
+                "text_length": content['text_length'],
+                "quality_score": quality_score,
+                "headings_count": content['headings_count'],
+                "paragraphs_count": content['paragraphs_count'],
+                "links_count": len(links),
+                "images_count": len(media['images']),
+                "videos_count": len(media['videos']),
+                "lists_count": content['lists_count'],
+                "tables_count": content['tables_count'],
+                "scraped_at": datetime.now(timezone.utc).isoformat(),
+                "response_time": time.time(),
+                "status_code": response.status,
+                "content_type": response.headers.get('content-type', ''),
+                "last_modified": response.headers.get('last-modified', ''),
+            }
+            
+            return result
     
     def _calculate_quality_score(self, content: Dict, html_length: int) -> float:
         """Calculate content quality score (0-1)"""
@@ -524,8 +849,8 @@ class EnhancedWebScraper:
         if content['title'] and len(content['title']) > 10:
             score += 0.2
         
-        # Content length
-        text_length = len(content['main_content'])
+        # Content length (full pre-truncation length when available)
+        text_length = content.get('text_length', len(content['main_content']))
         if text_length > 500:
             score += 0.3
         elif text_length > 200:
@@ -534,11 +859,12 @@ class EnhancedWebScraper:
             score += 0.1
         
         # Structure
-        if content['headings']:
+        if content['headings_count']:
             score += 0.2
-        if content['paragraphs']:
+        paragraphs_count = content['paragraphs_count']
+        if paragraphs_count:
             score += 0.2
-        if len(content['paragraphs']) > 3:
+        if paragraphs_count > 3:
             score += 0.1
         
         # Text to HTML ratio (content density)
@@ -551,33 +877,51 @@ class EnhancedWebScraper:
         
         return min(1.0, score)
     
-    async def scrape_multiple_urls(self, urls: List[str], max_concurrent: int = 5) -> List[Dict]:
-        """Scrape multiple URLs concurrently"""
+    async def _iter_scrape(self, urls: List[str], max_concurrent: int):
+        """Yield (index, result) as URLs complete
+
+        Keeps at most max_concurrent tasks scheduled: the next URL is
+        only submitted when one finishes, so a huge URL list never
+        materializes a task (or buffers a result) per entry up front.
+        """
         semaphore = asyncio.Semaphore(max_concurrent)
-        
-        async def scrape_with_semaphore(url: str) -> Dict:
-            async with semaphore:
-                result = await self.scrape_url(url)
-                # Add delay between requests
-                if self.config.delay_between_requests > 0:
-                    await asyncio.sleep(self.config.delay_between_requests)
-                return result
-        
-        tasks = [scrape_with_semaphore(url) for url in urls]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Handle exceptions
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                processed_results.append({
-                    "error": f"Exception: {str(result)}",
-                    "url": urls[i]
-                })
-            else:
-                processed_results.append(result)
-        
-        return processed_results
+        url_iter = enumerate(urls)
+        pending = {}
+
+        def schedule_next():
+            for i, url in itertools.islice(url_iter, 1):
+                task = asyncio.ensure_future(
+                    self.scrape_url(url, semaphore=semaphore)
+                )
+                pending[task] = (i, url)
+
+        for _ in range(max_concurrent):
+            schedule_next()
+
+        while pending:
+            done, _ = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                i, url = pending.pop(task)
+                schedule_next()
+                exc = task.exception()
+                if exc is not None:
+                    yield i, {"error": f"Exception: {str(exc)}", "url": url}
+                else:
+                    yield i, task.result()
+
+    async def iter_scrape(self, urls: List[str], max_concurrent: int = 5) -> AsyncIterator[Dict]:
+        """Stream scrape results in completion order"""
+        async for _, result in self._iter_scrape(urls, max_concurrent):
+            yield result
+
+    async def scrape_multiple_urls(self, urls: List[str], max_concurrent: int = 5) -> List[Dict]:
+        """Scrape multiple URLs concurrently; results follow input order"""
+        results: List[Dict] = [None] * len(urls)
+        async for i, result in self._iter_scrape(urls, max_concurrent):
+            results[i] = result
+        return results
 
 # Usage example and testing functions
 async def test_enhanced_scraper():
@@ -609,5 +953,7 @@ async def test_enhanced_scraper():
                 print(f"   Links: {result['links_count']} ({len([l for l in result['links'] if l['type'] == 'internal'])} internal)")
                 print()
 
+    await close_shared_session()
+
 if __name__ == "__main__":
     asyncio.run(test_enhanced_scraper())
\ No newline at end of file
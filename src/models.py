@@ -0,0 +1,62 @@
+"""Pydantic models for the Web Scraper API
+
+Kept in their own module so the definitions build once at import and the
+file stays a self-contained target for an ahead-of-time compiler pass
+(mypyc/cython) if one is ever wired into the build.
+"""
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, HttpUrl
+
+class UserCreate(BaseModel):
+    username: str
+    email: str
+    password: str
+
+class UserLogin(BaseModel):
+    email: str
+    password: str
+
+class User(BaseModel):
+    id: str
+    username: str
+    email: str
+
+class TaskCreate(BaseModel):
+    url: HttpUrl
+
+class Task(BaseModel):
+    id: str
+    url: str
+    status: str
+    created_at: datetime
+    completed_at: Optional[datetime] = None
+    result: Optional[dict] = None
+    error: Optional[str] = None
+
+class DataSubmit(BaseModel):
+    url: HttpUrl
+    title: str
+    headings: List[str]
+    paragraphs: List[str]
+
+class ScrapeRequest(BaseModel):
+    url: str
+    depth: int = 1
+    max_pages: int = 5
+
+class BatchScrapeRequest(BaseModel):
+    urls: List[HttpUrl]
+
+class EnhancedScrapeRequest(BaseModel):
+    url: str
+    depth: int = 1
+    max_pages: int = 5
+    include_ml_analysis: bool = True
+
+class Token(BaseModel):
+    access_token: str
+    token_type: str
+    user: User
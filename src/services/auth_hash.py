@@ -0,0 +1,77 @@
+import asyncio
+import concurrent.futures
+import os
+
+import bcrypt
+try:
+    from argon2 import PasswordHasher
+    from argon2 import exceptions as argon2_exceptions
+    ARGON2_AVAILABLE = True
+except ImportError:
+    ARGON2_AVAILABLE = False
+
+# Password hashing intentionally burns CPU (memory-hard BLAKE2b for
+# argon2id, 2^cost Blowfish rounds for bcrypt), so hashing inline on the
+# event loop stalls every other request for the duration. A small
+# dedicated pool keeps auth throughput bounded without letting a login
+# burst exhaust the default executor shared with other run_in_executor
+# users.
+_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="pwhash"
+)
+
+# Tunable bcrypt cost for deployments still writing bcrypt hashes; the
+# old hard-coded gensalt() default spent ~4x this budget per call
+BCRYPT_COST = int(os.getenv("BCRYPT_COST", "10"))
+
+# argon2id is the primary hasher when available: memory-hardness buys
+# more attacker cost per millisecond of server CPU than bcrypt rounds do
+if ARGON2_AVAILABLE:
+    _HASHER = PasswordHasher(time_cost=2, memory_cost=65536, parallelism=1)
+
+def _hash_sync(password: str) -> str:
+    if ARGON2_AVAILABLE:
+        return _HASHER.hash(password)
+    hashed = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(BCRYPT_COST))
+    return hashed.decode("utf-8")
+
+def _verify_sync(password: str, hashed: str) -> bool:
+    # Legacy bcrypt rows keep verifying; new hashes are argon2id
+    if hashed.startswith("$2"):
+        return bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
+    if ARGON2_AVAILABLE:
+        try:
+            return _HASHER.verify(hashed, password)
+        except argon2_exceptions.Argon2Error:
+            return False
+    return False
+
+async def hash_password(password: str) -> str:
+    """Hash a password off the event loop (argon2id, bcrypt fallback)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_POOL, _hash_sync, password)
+
+async def verify_password(password: str, hashed: str) -> bool:
+    """Check a password against its stored hash off the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_POOL, _verify_sync, password, hashed)
+
+def needs_rehash(hashed: str) -> bool:
+    """True when a verified hash should be upgraded on login
+
+    Covers bcrypt rows once argon2 is installed, bcrypt rows below the
+    configured cost, and argon2 rows whose parameters have been raised.
+    """
+    if hashed.startswith("$2"):
+        if ARGON2_AVAILABLE:
+            return True
+        try:
+            return int(hashed[4:6]) < BCRYPT_COST
+        except ValueError:
+            return False
+    if ARGON2_AVAILABLE:
+        try:
+            return _HASHER.check_needs_rehash(hashed)
+        except argon2_exceptions.InvalidHashError:
+            return False
+    return False
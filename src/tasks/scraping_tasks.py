@@ -2,6 +2,7 @@ from celery import current_task
 from src.celery_app import celery_app
 import motor.motor_asyncio
 import asyncio
+import redis
 from datetime import datetime
 import os
 from dotenv import load_dotenv
@@ -123,5 +124,16 @@ async def update_task_status(task_id: str, status: str, error: str = None):
             {'$set': update_data}
         )
         
+        # Drop the API's task:{id} cache entry so /tasks re-reads the
+        # updated document from Mongo instead of serving the stale
+        # "pending" body written at creation for up to its full TTL
+        try:
+            redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
+            redis_client = redis.from_url(redis_url)
+            redis_client.delete(f"task:{task_id}")
+            redis_client.close()
+        except Exception as cache_error:
+            print(f"Error invalidating task cache: {cache_error}")
+        
     except Exception as e:
         print(f"Error updating task status: {e}") 
\ No newline at end of file